@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# Sebastian Claudiusz Magierowski Sep 1 2026
+#
+"""Generate all three characterization figures in a single process.
+
+Running plot_av.py, plot_gmId.py and plot_fet.py separately pays the
+matplotlib import cost three times; this entry point imports once and
+reuses the parsed data caches across figures.
+"""
+
+import sys
+import os
+
+# Save-only runs (CI, run_*.sh automation) skip the GUI backend entirely
+if os.environ.get("SMRCT_BATCH") or not sys.stdout.isatty():
+    import matplotlib
+    matplotlib.use("Agg")
+
+import plotting
+
+if __name__ == "__main__":
+    plotting.plot_av()
+    plotting.plot_gmId()
+    plotting.plot_summary()
+    plotting.show()
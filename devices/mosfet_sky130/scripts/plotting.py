@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+# Sebastian Claudiusz Magierowski Sep 1 2026
+#
+"""Shared loaders and figure builders for the sky130 FET characterization plots.
+
+plot_av.py / plot_gmId.py / plot_fet.py are thin entry points around
+plot_av() / plot_gmId() / plot_summary(); plot_all.py generates all three
+figures in a single process so matplotlib is imported (and each data file
+parsed) only once.
+"""
+
+import sys
+import os
+import io
+import json
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.image as mpimg
+from matplotlib.ticker import MaxNLocator
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None  # fall back to the NumPy >= 1.23 C loadtxt parser
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None  # plain NumPy for the derived-quantity arithmetic
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # C tokenizer handles all sweep sizes
+
+# numexpr fuses the derived-quantity expressions into one multithreaded
+# pass, but only pays off on large sweeps; below this the per-call
+# overhead dominates.
+_NE_MIN_SIZE = 10000
+
+# Number of major ticks on left and right y-axes (for dual-axis plots)
+N_TICKS_LEFT = 6
+N_TICKS_RIGHT = 5
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEVICE_DIR = os.path.dirname(SCRIPT_DIR)
+REPO_DIR = os.path.dirname(os.path.dirname(DEVICE_DIR))
+WATERMARK_FILE = os.path.join(REPO_DIR, "docs", "emil_tran.png")
+GMID_DATA_FILE = os.path.join(DEVICE_DIR, "results", "gmId", "gmId_data.txt")
+AV_DATA_FILE = os.path.join(DEVICE_DIR, "results", "av", "av_data.txt")
+GMID_PLOT_FILE = os.path.join(DEVICE_DIR, "results", "gmId", "fet_gmId_vs_vgs.png")
+AV_PLOT_FILE = os.path.join(DEVICE_DIR, "results", "av", "nfet_av_vs_vds.png")
+SUMMARY_PLOT_FILE = os.path.join(DEVICE_DIR, "results", "fet_summary.png")
+
+
+# Only hand very large numeric blocks (~100k+ rows of PVT-corner sweeps)
+# to the numba parser; below this the C tokenizer is just as fast and
+# skips any risk of a first-run JIT compile.
+_NUMBA_PARSE_MIN_BYTES = 4 << 20
+
+if njit is not None:
+    @njit(cache=True)
+    def _scan_floats(buf, out):
+        """Parse whitespace-separated floats from a byte buffer into out.
+
+        Hand-rolled strtod equivalent (sign, digits, fraction, exponent,
+        nan/inf, and # comments skipped to end of line); accurate to
+        ~1 ulp, which is far below what the plots resolve. Returns the
+        number of tokens written, or -1 the moment a token is not a
+        well-formed float so the caller can fall back to the C tokenizer
+        instead of accepting corrupt data.
+        """
+        n = buf.shape[0]
+        total = out.size
+        i = 0
+        k = 0
+        while i < n:
+            c = buf[i]
+            if c == 32 or c == 9 or c == 10 or c == 13:
+                i += 1
+                continue
+            if c == 35:      # '#': comment runs to end of line
+                while i < n and buf[i] != 10:
+                    i += 1
+                continue
+            if k >= total:   # more tokens than rows*ncols can hold
+                return -1
+            sign = 1.0
+            if c == 43:      # '+'
+                i += 1
+            elif c == 45:    # '-'
+                sign = -1.0
+                i += 1
+            if i < n and (buf[i] == 110 or buf[i] == 78):    # nan / NaN
+                if (i + 2 >= n
+                        or (buf[i + 1] != 97 and buf[i + 1] != 65)
+                        or (buf[i + 2] != 110 and buf[i + 2] != 78)):
+                    return -1
+                out[k] = np.nan
+                i += 3
+            elif i < n and (buf[i] == 105 or buf[i] == 73):  # inf / Inf
+                if (i + 2 >= n
+                        or (buf[i + 1] != 110 and buf[i + 1] != 78)
+                        or (buf[i + 2] != 102 and buf[i + 2] != 70)):
+                    return -1
+                out[k] = sign * np.inf
+                i += 3
+            else:
+                ndig = 0
+                mant = 0.0
+                while i < n and 48 <= buf[i] <= 57:
+                    mant = mant * 10.0 + (buf[i] - 48)
+                    ndig += 1
+                    i += 1
+                if i < n and buf[i] == 46:   # '.'
+                    i += 1
+                    scale = 0.1
+                    while i < n and 48 <= buf[i] <= 57:
+                        mant += (buf[i] - 48) * scale
+                        scale *= 0.1
+                        ndig += 1
+                        i += 1
+                if ndig == 0:    # no mantissa digits: not a float token
+                    return -1
+                exp = 0
+                if i < n and (buf[i] == 101 or buf[i] == 69):   # 'e' / 'E'
+                    i += 1
+                    esign = 1
+                    if i < n and (buf[i] == 43 or buf[i] == 45):
+                        if buf[i] == 45:
+                            esign = -1
+                        i += 1
+                    edig = 0
+                    while i < n and 48 <= buf[i] <= 57:
+                        exp = exp * 10 + (buf[i] - 48)
+                        edig += 1
+                        i += 1
+                    if edig == 0:    # bare exponent marker
+                        return -1
+                    exp *= esign
+                out[k] = sign * mant * 10.0 ** exp
+            # A valid token ends at whitespace or EOF; anything else
+            # (e.g. "1.0x") is not ours to guess at.
+            if i < n:
+                c = buf[i]
+                if c != 32 and c != 9 and c != 10 and c != 13:
+                    return -1
+            k += 1
+        return k
+
+
+def _parse_body_numba(body_text):
+    """Parse the numeric block with the numba kernel; None if it can't.
+
+    Column count comes from the first non-comment line, row capacity
+    from the newline count; a malformed token (kernel returns -1) or a
+    token-count mismatch (ragged rows) falls back to the C tokenizer.
+    """
+    ncols = 0
+    start = 0
+    while start < len(body_text):
+        end = body_text.find("\n", start)
+        if end == -1:
+            end = len(body_text)
+        s = body_text[start:end].strip()
+        if s and not s.startswith("#"):
+            ncols = len(s.split())
+            break
+        start = end + 1
+    if ncols == 0:
+        return None
+    buf = np.frombuffer(body_text.encode(), dtype=np.uint8)
+    max_rows = int(np.count_nonzero(buf == 10)) + 1
+    out = np.empty(max_rows * ncols, dtype=np.float64)
+    ntok = _scan_floats(buf, out)
+    if ntok <= 0 or ntok % ncols != 0:
+        return None
+    return out[:ntok].reshape(ntok // ncols, ncols)
+
+
+# ── Helper: parse # key = value metadata and numeric rows in one pass ──
+def _parse_file(filepath):
+    """Single pass over a wrdata file: metadata dict plus float64 data.
+
+    The file is opened once; '# key = value' lines feed the metadata
+    dict, the wrdata vector-names line is skipped, and the remaining
+    numeric lines go to a C parser.
+    """
+    with open(filepath) as f:
+        text = f.read()
+    # Walk only the header region line by line; once the wrdata
+    # vector-names line is consumed, the rest of the buffer is handed to
+    # the C parser in one piece — no per-line Python list is built.
+    metadata = {}
+    pos = 0
+    end = len(text)
+    while pos < end:
+        eol = text.find("\n", pos)
+        if eol == -1:
+            eol = end
+        s = text[pos:eol].strip()
+        pos = eol + 1
+        if s.startswith("#"):
+            if "=" in s:
+                key, val = s[1:].split("=", 1)
+                metadata[key.strip()] = val.strip()
+        elif s:
+            break  # wrdata vector-names line; numeric rows follow
+    body_text = text[pos:]
+    if njit is not None and len(body_text) >= _NUMBA_PARSE_MIN_BYTES:
+        data = _parse_body_numba(body_text)
+        if data is not None:
+            return metadata, data
+    body = io.StringIO(body_text)
+    if pd is not None:
+        data = pd.read_csv(body, sep=r"\s+", header=None, comment="#",
+                           engine="c", dtype=np.float64, na_filter=False).to_numpy()
+    else:
+        # NumPy >= 1.23: loadtxt's C parser streams tokens into a pre-sized
+        # float64 buffer, so no per-cell Python objects are created either way.
+        data = np.loadtxt(body, comments="#", dtype=np.float64)
+    return metadata, data
+
+# In-process memo keyed on (path, mtime): plot_summary reuses the arrays
+# plot_gmId / plot_av already parsed when run in the same process
+# (plot_all.py), at zero cost. Callers must not mutate the returned array.
+_data_memo = {}
+
+def load(filepath):
+    """Load (metadata, data), reusing sidecar caches when still fresh.
+
+    The text parse is the hottest part of these scripts; np.load on the
+    cached float64 array (plus a small .json for the metadata) is
+    effectively free on plot-only re-runs, and repeat loads in the same
+    process are served from memory.
+    """
+    key = (filepath, os.path.getmtime(filepath))
+    cached = _data_memo.get(key)
+    if cached is not None:
+        return cached
+    data_cache = filepath + ".npy"
+    meta_cache = filepath + ".meta.json"
+    if (os.path.exists(data_cache) and os.path.getmtime(data_cache) >= key[1]
+            and os.path.exists(meta_cache) and os.path.getmtime(meta_cache) >= key[1]):
+        # mmap the cache: column reads stream through the OS page cache
+        # instead of allocating RSS for the whole array up front.
+        data = np.load(data_cache, mmap_mode="r")
+        with open(meta_cache) as f:
+            metadata = json.load(f)
+    else:
+        metadata, data = _parse_file(filepath)
+        np.save(data_cache, data)
+        with open(meta_cache, "w") as f:
+            json.dump(metadata, f)
+    _data_memo[key] = (metadata, data)
+    return metadata, data
+
+
+def format_L(L_um):
+    """LaTeX-format the channel length for titles: nm if < 1 um."""
+    return f"{L_um*1000:.0f}\\,nm" if L_um < 1 else f"{L_um:.1f}\\,\\mu m"
+
+
+def format_suptitle(W_um, L_um, corner):
+    """Standard device headline shared by the grid figures."""
+    return (rf'sky130 nfet_01v8   $W = {W_um:.0f}\,\mu m$,  '
+            rf'$L = {format_L(L_um)}$,  corner = {corner}')
+
+
+# Above this many points Agg draws one path per marker and savefig time
+# is dominated by the circles; draw lines only on dense sweeps.
+_MARKER_MAX_POINTS = 500
+
+def _fmt(style, n):
+    """Return the plot format string, dropping the marker for dense sweeps."""
+    return style.replace("o", "") if n > _MARKER_MAX_POINTS else style
+
+
+def _reciprocal(g):
+    """Output resistance 1/g with non-conducting points masked out.
+
+    Masking g <= 0 says what the old `1.0 / (g + 1e-30)` idiom only
+    approximated: those samples have no meaningful ro. matplotlib draws
+    gaps at masked points, the masked max is ignored by the axis-limit
+    reductions, and no epsilon biases the valid samples.
+    """
+    return 1.0 / np.ma.masked_less_equal(g, 0)
+
+
+def _max_in_window(x, y, lo, hi):
+    """Max of y over points where lo <= x <= hi.
+
+    Sweeps are typically monotonic in x, so locate the window with two
+    binary searches and reduce over a slice (a view) instead of building
+    a boolean mask plus a fancy-indexed copy of y.
+    """
+    if np.all(np.diff(x) >= 0):
+        i0 = np.searchsorted(x, lo, side="left")
+        i1 = np.searchsorted(x, hi, side="right")
+        sel = y[i0:i1]
+    else:
+        sel = y[(x >= lo) & (x <= hi)]
+    return sel.max()
+
+
+def _dual_axis(ax, x, yL, yR, *, labelL, labelR, xlabel, ylabelL, ylabelR,
+               title, legend_loc, xlim=None, ylimR=None):
+    """Configure a blue-left / red-right dual y-axis subplot in one pass.
+
+    Factors the grid-subplot boilerplate (tick colors, MaxNLocator
+    settings, legend from kept handles) that was repeated per quadrant,
+    so matplotlib batches the property updates per subplot instead of
+    re-invalidating layout across six hand-written copies. xlim defaults
+    to the x data range; ylimR defaults to bottom=0 — pass an explicit
+    (lo, hi) to pin a computed window. Returns the twin axes.
+    """
+    lnL, = ax.plot(x, yL, _fmt('b-o', x.size), markersize=3, linewidth=1.5, label=labelL)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabelL, color='b')
+    ax.tick_params(axis='y', labelcolor='b')
+    ax.set_xlim(xlim if xlim is not None else (x.min(), x.max()))
+    ax.set_ylim(bottom=0)
+    ax.yaxis.set_major_locator(MaxNLocator(nbins=N_TICKS_LEFT, min_n_ticks=N_TICKS_LEFT))
+    ax.grid(True, alpha=0.3)
+
+    axr = ax.twinx()
+    lnR, = axr.plot(x, yR, _fmt('r-o', x.size), markersize=2, linewidth=1.5, label=labelR)
+    axr.set_ylabel(ylabelR, color='r')
+    axr.tick_params(axis='y', labelcolor='r')
+    if ylimR is None:
+        axr.set_ylim(bottom=0)
+    else:
+        axr.set_ylim(*ylimR)
+    axr.yaxis.set_major_locator(MaxNLocator(nbins=N_TICKS_RIGHT, min_n_ticks=N_TICKS_RIGHT))
+
+    ax.legend([lnL, lnR], [lnL.get_label(), lnR.get_label()], loc=legend_loc, fontsize=10)
+    ax.set_title(title)
+    return axr
+
+
+def _save(fig, path):
+    """Save a figure at 150 dpi with light PNG compression.
+
+    zlib level 1 encodes several times faster than Pillow's default
+    level 6 at ~20% larger file size — the right trade for plots that
+    are regenerated on every run.
+    """
+    fig.savefig(path, dpi=150, pil_kwargs={"compress_level": 1})
+    print(f"Plot saved to {path}")
+
+
+def _require(filepath, runner):
+    if not os.path.exists(filepath):
+        print(f"Error: {filepath} not found. Run {runner} first.")
+        sys.exit(1)
+
+
+def show():
+    """Show figures interactively unless running in batch mode."""
+    if sys.stdout.isatty() and not os.environ.get("SMRCT_BATCH"):
+        plt.show()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  Intrinsic gain vs Vds (from nfet_av.sp)
+# ══════════════════════════════════════════════════════════════════════════════
+def plot_av(fig=None):
+    """Plot intrinsic gain (av = gm/gds) vs Vds from nfet_av.sp simulation data."""
+    _require(AV_DATA_FILE, "run_av.sh")
+
+    metadata, data = load(AV_DATA_FILE)
+    W_um = float(metadata.get("W_um", "1"))
+    L_um = float(metadata.get("L_um", "0.15"))
+    Id_uA = float(metadata.get("Id_uA", "10"))
+    corner = metadata.get("corner", "tt")
+    source = metadata.get("source", "unknown")
+    date = metadata.get("date", "unknown")
+
+    print(f"Source: {source}  Date: {date}")
+    print(f"W = {W_um} um,  L = {L_um} um,  Id = {Id_uA} uA,  corner = {corner}")
+
+    # Data columns: v-sweep  vd  vg  id_ua  gm  gds  av
+    # Transpose once so each column is a contiguous 1-D array; the derived
+    # arithmetic and min/max reductions then stream memory instead of
+    # striding across rows. float32 keeps ~7 significant digits — far
+    # more than a 150-dpi plot resolves — at half the memory bandwidth;
+    # the float64 parse/cache stays the source of truth.
+    cols = np.ascontiguousarray(data.T, dtype=np.float32)
+
+    vds = cols[0]
+    vd  = cols[1]
+    vg  = cols[2]
+    id_ua = cols[3]
+    gm  = cols[4]
+    gds = cols[5]
+    av  = cols[6]
+    ro  = _reciprocal(gds)  # output resistance in Ohms
+
+    L_str = format_L(L_um)
+
+    if fig is None:
+        fig = plt.figure(figsize=(8, 5))
+    ax = fig.add_subplot(111)
+    ln, = ax.plot(vds, av, _fmt('b-o', vds.size), markersize=4, linewidth=1.5, label=r'$a_v$')
+    ax.set_xlabel(r'$V_{DS}$ (V)', fontsize=13)
+    ax.set_ylabel(r'Intrinsic Gain $a_v = g_m / g_{ds}$ (V/V)', fontsize=13, color='b')
+    ax.tick_params(axis='y', labelcolor='b')
+    ax.set_title(
+        rf'sky130 nfet_01v8   $W = {W_um:.0f}\,\mu m$,  $L = {L_str}$,  $I_D = {Id_uA:.0f}\,\mu A$',
+        fontsize=12)
+    ax.grid(True, alpha=0.3)
+    ax.set_xlim(vds.min(), vds.max())
+    ax.set_ylim(bottom=0)
+
+    axr = ax.twinx()
+    lnr, = axr.plot(vds, ro * 1e-3, _fmt('r-o', vds.size), markersize=3, linewidth=1.5, label=r'$r_o$')
+    axr.set_ylabel(r'$r_o$ (k$\Omega$)', fontsize=13, color='r')
+    axr.tick_params(axis='y', labelcolor='r')
+    axr.set_ylim(bottom=0)
+
+    ax.legend([ln, lnr], [ln.get_label(), lnr.get_label()], loc='center right', fontsize=11)
+
+    fig.tight_layout()
+    _save(fig, AV_PLOT_FILE)
+    return fig
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  gm/Id characterization grid (from fet_gmId.sp)
+# ══════════════════════════════════════════════════════════════════════════════
+def plot_gmId(fig=None):
+    """Plot gm/Id characterization: 2x2 grid of key analog design metrics."""
+    _require(GMID_DATA_FILE, "run_gmId.sh")
+
+    metadata, data = load(GMID_DATA_FILE)
+    W_um = float(metadata.get("W_um", "1"))
+    L_um = float(metadata.get("L_um", "0.15"))
+    device = metadata.get("device", "unknown")
+    corner = metadata.get("corner", "tt")
+    source = metadata.get("source", "unknown")
+    date = metadata.get("date", "unknown")
+
+    print(f"Source: {source}  Date: {date}")
+    print(f"Device: {device}  W = {W_um} um,  L = {L_um} um,  corner = {corner}")
+
+    # Data columns: v-sweep vgs id_ua gm gds vth gm_id vstar ft_GHz vdsat vgsteff
+    # Transpose once so each column is a contiguous 1-D array; the derived
+    # arithmetic and min/max reductions then stream memory instead of
+    # striding across rows. float32 keeps ~7 significant digits — far
+    # more than a 150-dpi plot resolves — at half the memory bandwidth;
+    # the float64 parse/cache stays the source of truth.
+    cols = np.ascontiguousarray(data.T, dtype=np.float32)
+
+    vgs     = cols[1]
+    id_ua   = cols[2]
+    gm      = cols[3]
+    gds     = cols[4]
+    vth     = cols[5]
+    gm_id   = cols[6]
+    vstar   = cols[7] * 1e3   # V -> mV
+    ft_GHz  = cols[8]
+    vdsat   = cols[9]
+    vgsteff = cols[10]
+
+    # Derived. gm * ro stays in NumPy: ro is a masked array and
+    # ne.evaluate would silently drop the mask, plotting the very
+    # non-conducting points the masking suppresses.
+    ro = _reciprocal(gds)
+    gm_ro = gm * ro
+    if ne is not None and gds.size >= _NE_MIN_SIZE:
+        ft_gm_id = ne.evaluate("ft_GHz * gm_id")   # GHz/V
+    else:
+        ft_gm_id = ft_GHz * gm_id    # GHz/V
+
+    suptitle = format_suptitle(W_um, L_um, corner)
+
+    if fig is None:
+        fig = plt.figure(figsize=(12, 9))
+    axes = fig.subplots(2, 2)
+
+    # ╔══════════════════════════════════════════════════════════════════════════════╗
+    # ║  PLOT (1,1) — Upper Left: gm/Id and V* vs Vgs (dual y-axis)                  ║
+    # ║    Left y-axis (blue):  gm/Id in V^-1     — linear scale                     ║
+    # ║    Right y-axis (red):  V* = 2Id/gm in mV — linear scale                     ║
+    # ║    x-axis: Vgs (V)                                                           ║
+    # ╚══════════════════════════════════════════════════════════════════════════════╝
+    _dual_axis(axes[0, 0], vgs, gm_id, vstar,
+               labelL=r'$g_m/I_D$', labelR=r'$V^*$',
+               xlabel=r'$V_{GS}$ (V)',
+               ylabelL=r'$g_m / I_D$ (V$^{-1}$)',
+               ylabelR=r'$V^* = 2I_D/g_m$ (mV)',
+               title=r'$g_m/I_D$ and $V^*$ vs $V_{GS}$',
+               legend_loc='center left')
+
+    # ╔══════════════════════════════════════════════════════════════════════════════╗
+    # ║  PLOT (1,2) — Upper Right: Id vs V*                                          ║
+    # ║    y-axis: Id in uA        — log scale (semilogy)                            ║
+    # ║    x-axis: V* = 2Id/gm in mV                                                 ║
+    # ╚══════════════════════════════════════════════════════════════════════════════╝
+    ax2 = axes[0, 1]
+    ax2.plot(vstar, id_ua, _fmt('b-o', vstar.size), markersize=3, linewidth=1.5)
+    ax2.set_xlabel(r'$V^*$ (mV)')
+    ax2.set_ylabel(r'$I_D$ ($\mu$A)', color='b')
+    ax2.set_xlim(0, 800)
+    ax2.set_ylim(0, _max_in_window(vstar, id_ua, -np.inf, 800) * 1.05)
+    ax2.grid(True, alpha=0.3, which='both')
+    ax2.set_title(r'$I_D$ vs $V^*$')
+
+    # ╔══════════════════════════════════════════════════════════════════════════════╗
+    # ║  PLOT (2,1) — Lower Left: gm·ro and ro vs Vds (dual y-axis)                  ║
+    # ║    Left y-axis (blue):  gm·ro in V/V    — linear scale                       ║
+    # ║    Right y-axis (red):  ro in kOhm      — linear scale                       ║
+    # ║    x-axis: Vds (V)      (= Vgs since diode-connected)                        ║
+    # ╚══════════════════════════════════════════════════════════════════════════════╝
+    # only show ro values in a reasonable range of Vgsteff to avoid extreme ro values dominating the y-axis scale
+    _dual_axis(axes[1, 0], vgs, gm_ro, ro * 1e-3,
+               labelL=r'$g_m \cdot r_o$', labelR=r'$r_o$',
+               xlabel=r'$V_{DS}$ (V)',
+               ylabelL=r'$g_m \cdot r_o$ (V/V)',
+               ylabelR=r'$r_o$ (k$\Omega$)',
+               title=r'Intrinsic gain $g_m \cdot r_o$ and $r_o$ vs $V_{DS}$',
+               legend_loc='upper right',
+               ylimR=(0, _max_in_window(vgsteff, ro, 0.1, 1.0) * 1e-3 * 1.05))
+
+    # ╔══════════════════════════════════════════════════════════════════════════════╗
+    # ║  PLOT (2,2) — Lower Right: fT·gm/Id and fT vs V* (dual y-axis)               ║
+    # ║    Left y-axis (blue):  fT·gm/Id in GHz/V — linear scale                     ║
+    # ║    Right y-axis (red):  fT in GHz          — linear scale                    ║
+    # ║    x-axis: V* = 2Id/gm in mV                                                 ║
+    # ╚══════════════════════════════════════════════════════════════════════════════╝
+    _dual_axis(axes[1, 1], vstar, ft_gm_id, ft_GHz,
+               labelL=r'$f_T \cdot g_m/I_D$', labelR=r'$f_T$',
+               xlabel=r'$V^*$ (mV)',
+               ylabelL=r'$f_T \cdot g_m/I_D$ (GHz/V)',
+               ylabelR=r'$f_T$ (GHz)',
+               title=r'$f_T \cdot g_m/I_D$ and $f_T$ vs $V^*$',
+               legend_loc='lower right', xlim=(0, 800))
+
+    fig.suptitle(suptitle, fontsize=13, y=0.99)
+    fig.tight_layout()
+    _save(fig, GMID_PLOT_FILE)
+    return fig
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  Combined summary grid (gm/Id + av data)
+# ══════════════════════════════════════════════════════════════════════════════
+def plot_summary(fig=None):
+    """Combined FET characterization plot: 2x2 grid merging gm/Id and av data."""
+    _require(GMID_DATA_FILE, "run_gmId.sh")
+
+    gmid_meta, gmid_data = load(GMID_DATA_FILE)
+    gmid_cols = np.ascontiguousarray(gmid_data.T, dtype=np.float32)
+
+    W_um    = float(gmid_meta.get("W_um", "1"))
+    L_um    = float(gmid_meta.get("L_um", "0.15"))
+    device  = gmid_meta.get("device", "unknown")
+    corner  = gmid_meta.get("corner", "tt")
+
+    print(f"gmId data: {gmid_meta.get('source','?')}  {gmid_meta.get('date','?')}")
+    print(f"  Device: {device}  W = {W_um} um,  L = {L_um} um,  corner = {corner}")
+
+    # Data columns: v-sweep vgs id_ua gm gds vth gm_id vstar ft_GHz vdsat vgsteff
+    vgs      = gmid_cols[1]
+    id_ua_gm = gmid_cols[2]
+    gm_gm    = gmid_cols[3]
+    gds_gm   = gmid_cols[4]
+    gm_id    = gmid_cols[6]
+    vstar    = gmid_cols[7] * 1e3   # V -> mV
+    ft_GHz   = gmid_cols[8]
+    vgsteff  = gmid_cols[10]
+
+    if ne is not None and gm_id.size >= _NE_MIN_SIZE:
+        ft_gm_id = ne.evaluate("ft_GHz * gm_id")   # GHz/V
+    else:
+        ft_gm_id = ft_GHz * gm_id    # GHz/V
+
+    _require(AV_DATA_FILE, "run_av.sh")
+
+    av_meta, av_data = load(AV_DATA_FILE)
+    av_cols = np.ascontiguousarray(av_data.T, dtype=np.float32)
+
+    Id_uA = float(av_meta.get("Id_uA", "10"))
+    print(f"av data:   {av_meta.get('source','?')}  {av_meta.get('date','?')}")
+    print(f"  Id = {Id_uA} uA")
+
+    # Data columns: v-sweep vd vg id_ua gm gds av
+    vds_av = av_cols[0]
+    gds_av = av_cols[5]
+    av     = av_cols[6]
+    ro_av  = _reciprocal(gds_av)
+
+    suptitle = format_suptitle(W_um, L_um, corner)
+
+    if fig is None:
+        fig = plt.figure(figsize=(12, 9))
+    axes = fig.subplots(2, 2)
+
+    # ╔══════════════════════════════════════════════════════════════════════════════╗
+    # ║  PLOT (1,1) — Upper Left: gm/Id and V* vs Vgs (dual y-axis)                  ║
+    # ║    Left y-axis (blue):  gm/Id in V^-1     — linear scale                     ║
+    # ║    Right y-axis (red):  V* = 2Id/gm in mV — linear scale                     ║
+    # ║    x-axis: Vgs (V)                                                           ║
+    # ║    Data source: gmId_data.txt                                                ║
+    # ╚══════════════════════════════════════════════════════════════════════════════╝
+    _dual_axis(axes[0, 0], vgs, gm_id, vstar,
+               labelL=r'$g_m/I_D$', labelR=r'$V^*$',
+               xlabel=r'$V_{GS}$ (V)',
+               ylabelL=r'$g_m / I_D$ (V$^{-1}$)',
+               ylabelR=r'$V^* = 2I_D/g_m$ (mV)',
+               title=r'$g_m/I_D$ and $V^*$ vs $V_{GS}$',
+               legend_loc='center left')
+
+    # ╔══════════════════════════════════════════════════════════════════════════════╗
+    # ║  PLOT (1,2) — Upper Right: Id vs V*                                          ║
+    # ║    y-axis: Id in uA        — linear scale                                    ║
+    # ║    x-axis: V* = 2Id/gm in mV                                                 ║
+    # ║    Data source: gmId_data.txt                                                ║
+    # ╚══════════════════════════════════════════════════════════════════════════════╝
+    ax2 = axes[0, 1]
+    ax2.plot(vstar, id_ua_gm, _fmt('b-o', vstar.size), markersize=3, linewidth=1.5)
+    ax2.set_xlabel(r'$V^*$ (mV)')
+    ax2.set_ylabel(r'$I_D$ ($\mu$A)', color='b')
+    ax2.set_xlim(0, 800)
+    ax2.set_ylim(0, _max_in_window(vstar, id_ua_gm, -np.inf, 800) * 1.05)
+    ax2.grid(True, alpha=0.3, which='both')
+    ax2.set_title(r'$I_D$ vs $V^*$')
+
+    # ╔══════════════════════════════════════════════════════════════════════════════╗
+    # ║  PLOT (2,1) — Lower Left: av and ro vs Vds (dual y-axis)                     ║
+    # ║    Left y-axis (blue):  av = gm/gds in V/V — linear scale                    ║
+    # ║    Right y-axis (red):  ro = 1/gds in kOhm — linear scale                    ║
+    # ║    x-axis: Vds (V)      (constant Id bias)                                   ║
+    # ║    Data source: av_data.txt                                                  ║
+    # ╚══════════════════════════════════════════════════════════════════════════════╝
+    _dual_axis(axes[1, 0], vds_av, av, ro_av * 1e-3,
+               labelL=r'$a_v$', labelR=r'$r_o$',
+               xlabel=r'$V_{DS}$ (V)',
+               ylabelL=r'$a_v = g_m / g_{ds}$ (V/V)',
+               ylabelR=r'$r_o$ (k$\Omega$)',
+               title=rf'Intrinsic gain $a_v$ and $r_o$ vs $V_{{DS}}$  ($I_D = {Id_uA:.0f}\,\mu A$)',
+               legend_loc='lower right')
+
+    # ╔══════════════════════════════════════════════════════════════════════════════╗
+    # ║  PLOT (2,2) — Lower Right: fT·gm/Id and fT vs V* (dual y-axis)               ║
+    # ║    Left y-axis (blue):  fT·gm/Id in GHz/V — linear scale                     ║
+    # ║    Right y-axis (red):  fT in GHz          — linear scale                    ║
+    # ║    x-axis: V* = 2Id/gm in mV                                                 ║
+    # ║    Data source: gmId_data.txt                                                ║
+    # ╚══════════════════════════════════════════════════════════════════════════════╝
+    _dual_axis(axes[1, 1], vstar, ft_gm_id, ft_GHz,
+               labelL=r'$f_T \cdot g_m/I_D$', labelR=r'$f_T$',
+               xlabel=r'$V^*$ (mV)',
+               ylabelL=r'$f_T \cdot g_m/I_D$ (GHz/V)',
+               ylabelR=r'$f_T$ (GHz)',
+               title=r'$f_T \cdot g_m/I_D$ and $f_T$ vs $V^*$',
+               legend_loc='lower right', xlim=(0, 800))
+
+    fig.suptitle(suptitle, fontsize=13, y=0.99)
+    fig.tight_layout()
+
+    # Overlay watermark (light gray, centered behind plots)
+    if os.path.exists(WATERMARK_FILE):
+        wm_img = mpimg.imread(WATERMARK_FILE)
+        wm_ax = fig.add_axes([0.1, 0.15, 0.75, 0.75], anchor='C', zorder=10)
+        wm_ax.imshow(wm_img, alpha=0.08)
+        wm_ax.axis('off')
+
+    os.makedirs(os.path.dirname(SUMMARY_PLOT_FILE), exist_ok=True)
+    _save(fig, SUMMARY_PLOT_FILE)
+    return fig